@@ -1,88 +1,99 @@
 #!/usr/bin/env python3
 """Jissue CLI - Launch Claude Code with Jira MCP integration."""
 
-import argparse
-import json
 import os
-import subprocess
+import shutil
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+from jissue.config import CONFIG_DIR, CONFIG_PATH, load_config
+
+
+# Instructions for Claude appended to every initial prompt
+_PROMPT_INSTRUCTIONS = """
+Please help me by:
+1. First, get the project metadata to see available priorities and issue types
+2. Analyze my description and determine the appropriate issue type (bug/story/task/spike/etc)
+3. Suggest an appropriate priority based on the severity/importance
+4. Search for similar existing issues to avoid duplicates:
+   - Extract key concepts and search terms from my description
+   - Search using different combinations of keywords
+   - Look for semantic similarity, not just exact phrase matches
+   - Tell me if you find potentially duplicate issues
+5. Use the appropriate template to format the issue
+6. Show me the proposed issue (summary, description, type, priority)
+7. After I approve, create the issue in Jira"""
+
+_PROMPT_TEMPLATE_WITH_TEXT = (
+    "I need to create a Jira issue in project {project}.\n"
+    "\nHere's what I want to create:\n{text}\n"
+    + _PROMPT_INSTRUCTIONS
+)
+
+_PROMPT_TEMPLATE_ASK = (
+    "I need to create a Jira issue in project {project}.\n"
+    "\nPlease ask me what I want to create.\n"
+    + _PROMPT_INSTRUCTIONS
+)
+
+
+# Example config.json contents shown when no configuration exists
+_CLOUD_EXAMPLE_JSON = """{
+  "jira_url": "https://your-domain.atlassian.net",
+  "email": "your-email@example.com",
+  "api_token": "your-api-token",
+  "default_project": "PROJ"
+}"""
+
+_DATA_CENTER_EXAMPLE_JSON = """{
+  "jira_url": "https://jira.your-company.com",
+  "username": "your-username",
+  "password": "your-password-or-token",
+  "default_project": "PROJ"
+}"""
 
 
 def get_config_path() -> Path:
     """Get the Jissue configuration directory path."""
-    return Path.home() / ".jissue"
+    return CONFIG_DIR
 
 
 def ensure_config_exists():
     """Ensure configuration directory and files exist."""
     config_dir = get_config_path()
-    config_dir.mkdir(exist_ok=True)
 
-    # Create templates directory
+    # Nothing to do once config.json exists
+    config_file = CONFIG_PATH
+    if config_file.exists():
+        return
+
+    # First run: create configuration and templates directories
+    config_dir.mkdir(exist_ok=True)
     templates_dir = config_dir / "templates"
     templates_dir.mkdir(exist_ok=True)
 
-    # Check if config.json exists
-    config_file = config_dir / "config.json"
-    if not config_file.exists():
-        print(f"⚠️  Configuration file not found: {config_file}")
-        print("\nPlease create ~/.jissue/config.json with the following structure:")
-        print(json.dumps({
-            "jira_url": "https://your-domain.atlassian.net",
-            "email": "your-email@example.com",
-            "api_token": "your-api-token",
-            "default_project": "PROJ"
-        }, indent=2))
-        print("\nFor Jira Data Center, use:")
-        print(json.dumps({
-            "jira_url": "https://jira.your-company.com",
-            "username": "your-username",
-            "password": "your-password-or-token",
-            "default_project": "PROJ"
-        }, indent=2))
-        sys.exit(1)
+    print(f"⚠️  Configuration file not found: {config_file}")
+    print("\nPlease create ~/.jissue/config.json with the following structure:")
+    print(_CLOUD_EXAMPLE_JSON)
+    print("\nFor Jira Data Center, use:")
+    print(_DATA_CENTER_EXAMPLE_JSON)
+    sys.exit(1)
 
 
 def build_initial_prompt(args) -> str:
     """Build the initial prompt for Claude Code."""
     # Load config to get default project
-    import json
-    config_path = Path.home() / ".jissue" / "config.json"
     default_project = "PROJ"  # fallback
 
-    if config_path.exists():
-        with open(config_path) as f:
-            config = json.load(f)
-            default_project = config.get("default_project", default_project)
+    if CONFIG_PATH.exists():
+        default_project = load_config().get("default_project", default_project)
 
     # Use project from args if specified, otherwise use default
     project = args.project if hasattr(args, 'project') and args.project else default_project
 
-    parts = []
-
-    parts.append(f"I need to create a Jira issue in project {project}.")
-
-    if args.text:
-        parts.append(f"\nHere's what I want to create:\n{args.text}")
-    else:
-        parts.append("\nPlease ask me what I want to create.")
-
-    # Add instructions for Claude
-    parts.append("\nPlease help me by:")
-    parts.append("1. First, get the project metadata to see available priorities and issue types")
-    parts.append("2. Analyze my description and determine the appropriate issue type (bug/story/task/spike/etc)")
-    parts.append("3. Suggest an appropriate priority based on the severity/importance")
-    parts.append("4. Search for similar existing issues to avoid duplicates:")
-    parts.append("   - Extract key concepts and search terms from my description")
-    parts.append("   - Search using different combinations of keywords")
-    parts.append("   - Look for semantic similarity, not just exact phrase matches")
-    parts.append("   - Tell me if you find potentially duplicate issues")
-    parts.append("5. Use the appropriate template to format the issue")
-    parts.append("6. Show me the proposed issue (summary, description, type, priority)")
-    parts.append("7. After I approve, create the issue in Jira")
-
-    return "\n".join(parts)
+    template = _PROMPT_TEMPLATE_WITH_TEXT if args.text else _PROMPT_TEMPLATE_ASK
+    return template.format(project=project, text=args.text or "")
 
 
 def launch_claude_code(initial_prompt: str):
@@ -91,15 +102,8 @@ def launch_claude_code(initial_prompt: str):
     The MCP server should be configured in Claude Code's settings.
     """
     # Check if claude is available
-    try:
-        result = subprocess.run(
-            ["which", "claude"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        claude_path = result.stdout.strip()
-    except subprocess.CalledProcessError:
+    claude_path = shutil.which("claude")
+    if claude_path is None:
         print("⚠️  Claude Code not found in PATH.")
         print("\nPlease install Claude Code first:")
         print("https://github.com/anthropics/claude-code")
@@ -113,24 +117,23 @@ def launch_claude_code(initial_prompt: str):
     # Change to jissue directory so MCP server is detected
     jissue_dir = Path(__file__).parent.parent
     original_dir = Path.cwd()
+    os.chdir(jissue_dir)
 
+    # Replace this process with Claude Code, passing the message directly.
+    # Flush first: buffered output is discarded when the process image is replaced.
+    sys.stdout.flush()
     try:
-        # Launch Claude Code with the initial prompt as an argument
-        # Pass the message directly to claude
-        os.chdir(jissue_dir)
-        subprocess.run(
-            ["claude", initial_prompt],
-            check=False
-        )
-    except KeyboardInterrupt:
-        print("\n\nGoodbye!")
-    finally:
+        os.execv(claude_path, ["claude", initial_prompt])
+    except OSError as e:
         os.chdir(original_dir)
-        sys.exit(0)
+        print(f"⚠️  Failed to launch Claude Code: {e}")
+        sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+def _build_parser():
+    """Build the full argparse parser, used for help output and errors."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Jissue - AI-powered Jira issue creator. Just describe what you want and Claude will figure out the type, priority, and format it properly.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -181,7 +184,44 @@ Before using Jissue, make sure ~/.jissue/config.json is configured.
         help="Show setup instructions"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args(argv: list[str]):
+    """Parse command line arguments.
+
+    The common invocations are handled in a single pass over argv; argparse
+    is only imported for -h/--help, unknown options and malformed input.
+    """
+    project = None
+    setup = False
+    text = []
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            text.extend(argv[i + 1:])
+            break
+        if arg == "--setup":
+            setup = True
+        elif arg in ("-p", "--project") and i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+            i += 1
+            project = argv[i]
+        elif arg.startswith("--project="):
+            project = arg[len("--project="):]
+        elif arg.startswith("-") and arg != "-":
+            return _build_parser().parse_args(argv)
+        else:
+            text.append(arg)
+        i += 1
+
+    return SimpleNamespace(project=project, text=text, setup=setup)
+
+
+def main():
+    """Main CLI entry point."""
+    args = _parse_args(sys.argv[1:])
 
     # Show setup instructions if requested
     if args.setup:
@@ -0,0 +1,24 @@
+"""Configuration loading for Jissue."""
+
+import functools
+from pathlib import Path
+from typing import Any
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+CONFIG_DIR = Path.home() / ".jissue"
+CONFIG_PATH = CONFIG_DIR / "config.json"
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> dict[str, Any]:
+    """Load and cache configuration from ~/.jissue/config.json.
+
+    The file is read once per process; callers should check that it
+    exists first, as a missing file raises FileNotFoundError. Uses orjson
+    when it is installed, falling back to the standard library.
+    """
+    return _json_loads(CONFIG_PATH.read_bytes())
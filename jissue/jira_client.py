@@ -1,14 +1,43 @@
 """Jira client wrapper for creating and managing issues."""
 
+import functools
 import logging
 import os
-from pathlib import Path
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
-from jira import JIRA
+from jissue.config import CONFIG_PATH, load_config
+
+if TYPE_CHECKING:
+    from jira import JIRA
 
 logger = logging.getLogger(__name__)
 
+# Map common issue type names to Jira names
+_ISSUE_TYPE_MAP = {
+    "story": "Story",
+    "bug": "Bug",
+    "task": "Task",
+    "spike": "Spike",
+    "epic": "Epic",
+    "subtask": "Sub-task"
+}
+
+# Issue fields read when converting Jira issues to dicts
+_ISSUE_FIELDS = "summary,issuetype,status,priority,description,assignee"
+
+
+def _truncate(text: str, limit: int | None) -> str:
+    """Truncate text to limit characters, marking it with an ellipsis if cut."""
+    if limit is None or len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _jql_escape(value: str) -> str:
+    """Escape a value for use inside a double-quoted JQL string."""
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
 
 class JiraClientWrapper:
     """Wrapper for Jira API client."""
@@ -20,9 +49,7 @@ class JiraClientWrapper:
 
     def _load_config(self) -> dict[str, Any]:
         """Load configuration from ~/.jissue/config.json."""
-        import json
-
-        config_path = Path.home() / ".jissue" / "config.json"
+        config_path = CONFIG_PATH
 
         if not config_path.exists():
             raise FileNotFoundError(
@@ -36,11 +63,13 @@ class JiraClientWrapper:
                 "}"
             )
 
-        with open(config_path) as f:
-            return json.load(f)
+        return load_config()
 
-    def _connect(self) -> JIRA:
+    def _connect(self) -> "JIRA":
         """Connect to Jira."""
+        # Imported lazily: the jira package pulls in requests, urllib3, etc.
+        from jira import JIRA
+
         try:
             # Configure options
             options = {
@@ -69,7 +98,8 @@ class JiraClientWrapper:
                 )
                 logger.info("Using token authentication")
             elif "email" in self.config and "api_token" in self.config:
-                # Cloud authentication
+                # Cloud authentication. Keep the serverInfo call: it sets the
+                # deployment type, which jira needs to use Cloud's search API
                 jira = JIRA(
                     options=options,
                     basic_auth=(self.config["email"], self.config["api_token"]),
@@ -81,6 +111,7 @@ class JiraClientWrapper:
                 jira = JIRA(
                     options=options,
                     basic_auth=(self.config["username"], self.config["password"]),
+                    get_server_info=False,
                     proxies=proxies
                 )
                 logger.info("Using username + password authentication (Jira Data Center)")
@@ -96,6 +127,21 @@ class JiraClientWrapper:
             logger.error(f"Failed to connect to Jira: {e}")
             raise
 
+    @functools.cached_property
+    def _priority_names(self) -> tuple[str, ...]:
+        """Names of all priorities (global in Jira), fetched once per client."""
+        return tuple(p.name for p in self.jira.priorities())
+
+    @functools.cached_property
+    def _issue_type_names(self) -> tuple[str, ...]:
+        """Names of all issue types, fetched once per client."""
+        return tuple(it.name for it in self.jira.issue_types())
+
+    def clear_metadata_cache(self) -> None:
+        """Forget cached priorities and issue types so the next call re-fetches them."""
+        self.__dict__.pop("_priority_names", None)
+        self.__dict__.pop("_issue_type_names", None)
+
     def create_issue(
         self,
         project: str,
@@ -106,17 +152,7 @@ class JiraClientWrapper:
         assignee: str | None = None
     ) -> str:
         """Create a Jira issue and return the issue key."""
-        # Map common issue type names to Jira names
-        issue_type_map = {
-            "story": "Story",
-            "bug": "Bug",
-            "task": "Task",
-            "spike": "Spike",
-            "epic": "Epic",
-            "subtask": "Sub-task"
-        }
-
-        jira_issue_type = issue_type_map.get(issue_type.lower(), issue_type.capitalize())
+        jira_issue_type = _ISSUE_TYPE_MAP.get(issue_type.lower(), issue_type.capitalize())
 
         issue_dict = {
             "project": {"key": project},
@@ -159,14 +195,17 @@ class JiraClientWrapper:
         self,
         query: str,
         project: str | None = None,
-        max_results: int = 10
+        max_results: int = 10,
+        description_limit: int | None = None
     ) -> list[dict[str, Any]]:
         """Search for issues matching the query.
 
         Args:
-            query: Text to search in summary and description
+            query: Text to search in summary, description and other text fields
             project: Optional project key to limit search
             max_results: Maximum number of results to return
+            description_limit: Optional maximum description length; longer
+                descriptions are truncated with "..."
 
         Returns:
             List of issue dictionaries with key, summary, type, status, etc.
@@ -177,7 +216,8 @@ class JiraClientWrapper:
 
             # Add text search only if query is not empty
             if query and query.strip():
-                jql_parts.append(f'(summary ~ "{query}" OR description ~ "{query}")')
+                # text ~ covers summary, description and other text fields in one lookup
+                jql_parts.append(f'text ~ "{_jql_escape(query)}"')
 
             # Add project filter if specified
             if project:
@@ -193,24 +233,24 @@ class JiraClientWrapper:
             issues = self.jira.search_issues(
                 jql,
                 maxResults=max_results,
-                fields='summary,issuetype,status,priority,description,assignee'
+                fields=_ISSUE_FIELDS
             )
 
             # Convert to simple dict format
-            result = []
-            for issue in issues:
-                result.append({
+            browse_url = f"{self.config['jira_url']}/browse/"
+            return [
+                {
                     'key': issue.key,
                     'summary': issue.fields.summary,
                     'type': issue.fields.issuetype.name,
                     'status': issue.fields.status.name,
-                    'priority': issue.fields.priority.name if hasattr(issue.fields, 'priority') and issue.fields.priority else None,
-                    'description': issue.fields.description or '',
-                    'assignee': issue.fields.assignee.displayName if hasattr(issue.fields, 'assignee') and issue.fields.assignee else None,
-                    'url': self.get_issue_url(issue.key)
-                })
-
-            return result
+                    'priority': p.name if (p := getattr(issue.fields, 'priority', None)) else None,
+                    'description': _truncate(issue.fields.description or '', description_limit),
+                    'assignee': a.displayName if (a := getattr(issue.fields, 'assignee', None)) else None,
+                    'url': browse_url + issue.key
+                }
+                for issue in issues
+            ]
 
         except Exception as e:
             logger.error(f"Failed to search issues: {e}")
@@ -226,7 +266,7 @@ class JiraClientWrapper:
             Issue dictionary with detailed information
         """
         try:
-            issue = self.jira.issue(issue_key)
+            issue = self.jira.issue(issue_key, fields=_ISSUE_FIELDS)
 
             return {
                 'key': issue.key,
@@ -256,23 +296,34 @@ class JiraClientWrapper:
             # Get project to validate it exists
             project = self.jira.project(project_key)
 
-            # Get all priorities (global in Jira)
-            priorities = self.jira.priorities()
-            priority_list = [p.name for p in priorities]
-
-            # Get issue types for this project
-            issue_types = self.jira.issue_types()
-            issue_type_list = [it.name for it in issue_types]
-
             return {
                 'project': {
                     'key': project.key,
                     'name': project.name
                 },
-                'priorities': priority_list,
-                'issue_types': issue_type_list
+                'priorities': list(self._priority_names),
+                'issue_types': list(self._issue_type_names)
             }
 
         except Exception as e:
             logger.error(f"Failed to get project metadata for {project_key}: {e}")
             raise Exception(f"Failed to get project metadata: {str(e)}")
+
+
+_client_singleton: JiraClientWrapper | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> JiraClientWrapper:
+    """Return the shared JiraClientWrapper, creating it on first use.
+
+    Reusing one client keeps its HTTP session (and pooled keep-alive
+    connections) alive across calls.
+    """
+    global _client_singleton
+    if _client_singleton is None:
+        # Clients may be requested from several worker threads at once
+        with _client_lock:
+            if _client_singleton is None:
+                _client_singleton = JiraClientWrapper()
+    return _client_singleton
@@ -1,22 +1,87 @@
 #!/usr/bin/env python3
 """Jissue MCP Server - Provides Jira issue creation tools to Claude Code."""
 
+import asyncio
 import json
 import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, TypeVar
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from pydantic import BaseModel, Field
 
-from jissue.jira_client import JiraClientWrapper
 from jissue.templates import TemplateManager
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from jissue.jira_client import JiraClientWrapper
+
 logger = logging.getLogger("jissue-server")
 
+# Seconds to cache project lists and metadata, which change rarely
+_METADATA_CACHE_TTL = 600
+
+# Seconds between background refreshes; shorter than the TTL so entries stay warm
+_METADATA_REFRESH_INTERVAL = 300
+
+# Default maximum number of Jira requests in flight at once
+_DEFAULT_JIRA_CONCURRENCY = 5
+
+
+def _read_max_concurrency() -> int:
+    """Read the Jira concurrency limit from JISSUE_MAX_CONCURRENCY.
+
+    Invalid values fall back to the default and values below 1 are clamped
+    to 1, logging a warning in either case.
+    """
+    raw = os.environ.get("JISSUE_MAX_CONCURRENCY")
+    if raw is None:
+        return _DEFAULT_JIRA_CONCURRENCY
+
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid JISSUE_MAX_CONCURRENCY={raw!r}; using {_DEFAULT_JIRA_CONCURRENCY}"
+        )
+        return _DEFAULT_JIRA_CONCURRENCY
+
+    if value < 1:
+        logger.warning(f"JISSUE_MAX_CONCURRENCY={value} is below 1; using 1")
+        return 1
+
+    return value
+
+
+_MAX_JIRA_CONCURRENCY = _read_max_concurrency()
+
+# Maximum description length shown in search results
+_SEARCH_DESCRIPTION_LIMIT = 200
+
+T = TypeVar("T")
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize obj to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class TemplatesInput(BaseModel):
+    """Input for getting issue templates."""
+    issue_type: str | None = Field(default=None, description="Optional: specific issue type to get template for")
+
 
 class IssueInput(BaseModel):
     """Input for creating a Jira issue."""
@@ -24,8 +89,66 @@ class IssueInput(BaseModel):
     issue_type: str = Field(description="Issue type: story, bug, spike, task, etc.")
     summary: str = Field(description="Issue summary/title")
     description: str = Field(description="Issue description in Jira markdown format")
-    priority: str | None = Field(default=None, description="Priority name (use get_project_metadata to see valid priorities)")
-    assignee: str | None = Field(default=None, description="Assignee username")
+    priority: str | None = Field(default=None, description="Priority name (use get_project_metadata to get valid priorities for the project)")
+    assignee: str | None = Field(default=None, description="Assignee username (optional)")
+
+
+class ProjectsInput(BaseModel):
+    """Input for listing Jira projects (takes no arguments)."""
+
+
+class SearchInput(BaseModel):
+    """Input for searching Jira issues."""
+    query: str = Field(description="Search query text to search in summary and description. Use key concepts/keywords rather than full phrases for better results.")
+    project: str | None = Field(default=None, description="Optional: limit search to specific project key")
+    max_results: int = Field(default=10, description="Maximum number of results to return (default: 10)")
+    format: Literal["markdown", "json"] = Field(default="markdown", description="Output format: 'markdown' (default) or compact 'json' with truncated descriptions")
+
+
+class IssueKeyInput(BaseModel):
+    """Input for getting a single Jira issue."""
+    issue_key: str = Field(description="Jira issue key (e.g., 'PROJ-123')")
+
+
+class ProjectMetadataInput(BaseModel):
+    """Input for getting project metadata."""
+    project_key: str = Field(description="Jira project key (e.g., 'PROJ')")
+
+
+# Tool definitions are static, so build them once at import.
+# Input schemas are derived from the models above.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_issue_templates",
+        description="Get available Jira issue type templates (story, bug, spike, task, etc.) with formatting guidelines",
+        inputSchema=TemplatesInput.model_json_schema()
+    ),
+    Tool(
+        name="create_jira_issue",
+        description="Create a new Jira issue with the provided details",
+        inputSchema=IssueInput.model_json_schema()
+    ),
+    Tool(
+        name="get_jira_projects",
+        description="Get list of available Jira projects",
+        inputSchema=ProjectsInput.model_json_schema()
+    ),
+    Tool(
+        name="search_jira_issues",
+        description="Search for existing Jira issues using text search. Useful for finding similar/duplicate issues before creating new ones. TIP: For better duplicate detection, try multiple searches with different keyword combinations extracted from the user's description (e.g., core concepts, synonyms, related terms) rather than searching the full phrase once.",
+        inputSchema=SearchInput.model_json_schema()
+    ),
+    Tool(
+        name="get_jira_issue",
+        description="Get detailed information about a specific Jira issue by its key (e.g., PROJ-123)",
+        inputSchema=IssueKeyInput.model_json_schema()
+    ),
+    Tool(
+        name="get_project_metadata",
+        description="Get project metadata including available priorities and issue types. Use this before creating issues to know what priorities and types are valid.",
+        inputSchema=ProjectMetadataInput.model_json_schema()
+    )
+]
 
 
 class JissueServer:
@@ -34,7 +157,30 @@ class JissueServer:
     def __init__(self):
         self.server = Server("jissue")
         self.template_manager = TemplateManager()
-        self.jira_client: JiraClientWrapper | None = None
+
+        # The all-templates response never changes, so build it once
+        self._all_templates_content = [
+            TextContent(type="text", text=self.template_manager.get_rendered_all())
+        ]
+        self.jira_client: "JiraClientWrapper | None" = None
+
+        # Rendered project/metadata responses keyed by request, with fetch time
+        self._meta_cache: dict[tuple, tuple[float, Any]] = {}
+
+        # Loaders for cached entries, used to refresh them in the background
+        self._meta_loaders: dict[tuple, Callable[[], Awaitable[Any]]] = {}
+
+        # In-flight loads, so concurrent requests for the same key share one fetch
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+        # Limit concurrent requests to the Jira server
+        self._jira_sem = asyncio.Semaphore(_MAX_JIRA_CONCURRENCY)
+
+        # Map tool names to handler methods (each tool is handled by _<name>)
+        self._handlers = {
+            sys.intern(tool.name): getattr(self, f"_{tool.name}")
+            for tool in _TOOLS
+        }
 
         # Register handlers
         self.server.list_tools()(self.list_tools)
@@ -42,128 +188,86 @@ class JissueServer:
 
     async def list_tools(self) -> list[Tool]:
         """List available tools."""
-        return [
-            Tool(
-                name="get_issue_templates",
-                description="Get available Jira issue type templates (story, bug, spike, task, etc.) with formatting guidelines",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_type": {
-                            "type": "string",
-                            "description": "Optional: specific issue type to get template for"
-                        }
-                    }
-                }
-            ),
-            Tool(
-                name="create_jira_issue",
-                description="Create a new Jira issue with the provided details",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project": {
-                            "type": "string",
-                            "description": "Jira project key (e.g., 'PROJ')"
-                        },
-                        "issue_type": {
-                            "type": "string",
-                            "description": "Issue type: story, bug, spike, task, etc."
-                        },
-                        "summary": {
-                            "type": "string",
-                            "description": "Issue summary/title"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Issue description in Jira markdown format"
-                        },
-                        "priority": {
-                            "type": "string",
-                            "description": "Priority name (use get_project_metadata to get valid priorities for the project)"
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "Assignee username (optional)"
-                        }
-                    },
-                    "required": ["project", "issue_type", "summary", "description"]
-                }
-            ),
-            Tool(
-                name="get_jira_projects",
-                description="Get list of available Jira projects",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ),
-            Tool(
-                name="search_jira_issues",
-                description="Search for existing Jira issues using text search. Useful for finding similar/duplicate issues before creating new ones. TIP: For better duplicate detection, try multiple searches with different keyword combinations extracted from the user's description (e.g., core concepts, synonyms, related terms) rather than searching the full phrase once.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query text to search in summary and description. Use key concepts/keywords rather than full phrases for better results."
-                        },
-                        "project": {
-                            "type": "string",
-                            "description": "Optional: limit search to specific project key"
-                        },
-                        "max_results": {
-                            "type": "number",
-                            "description": "Maximum number of results to return (default: 10)"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            ),
-            Tool(
-                name="get_jira_issue",
-                description="Get detailed information about a specific Jira issue by its key (e.g., PROJ-123)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {
-                            "type": "string",
-                            "description": "Jira issue key (e.g., 'PROJ-123')"
-                        }
-                    },
-                    "required": ["issue_key"]
-                }
-            ),
-            Tool(
-                name="get_project_metadata",
-                description="Get project metadata including available priorities and issue types. Use this before creating issues to know what priorities and types are valid.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_key": {
-                            "type": "string",
-                            "description": "Jira project key (e.g., 'PROJ')"
-                        }
-                    },
-                    "required": ["project_key"]
-                }
-            )
-        ]
+        return list(_TOOLS)
+
+    def _get_client(self) -> "JiraClientWrapper":
+        """Get the Jira client, connecting on first use.
+
+        The first call imports jira and reads the config, so call this from a
+        worker thread (see _run_jira) rather than on the event loop.
+        """
+        if self.jira_client is None:
+            from jissue.jira_client import get_client
+            self.jira_client = get_client()
+        return self.jira_client
+
+    async def _run_jira(self, call: Callable[["JiraClientWrapper"], T]) -> T:
+        """Run call(client) in a worker thread.
+
+        The client is also created in the worker thread on first use, so the
+        jira import and connection setup never block the event loop. Calls are
+        bounded by the JISSUE_MAX_CONCURRENCY limit so bursts of tool calls
+        don't flood the Jira server.
+        """
+        async with self._jira_sem:
+            return await asyncio.to_thread(lambda: call(self._get_client()))
+
+    async def _single_flight(self, key: tuple, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight call for key, starting one if none is running."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    async def _cached(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached value for key, awaiting loader if missing or expired."""
+        entry = self._meta_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _METADATA_CACHE_TTL:
+            return entry[1]
+
+        return await self._refresh(key, loader)
+
+    async def _refresh(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Load a fresh value for key and store it in the cache."""
+        async def load() -> Any:
+            value = await loader()
+            self._meta_cache[key] = (time.monotonic(), value)
+            self._meta_loaders[key] = loader
+            return value
+
+        return await self._single_flight(key, load)
+
+    async def _bg_refresh_metadata(self) -> None:
+        """Keep cached project data warm so handlers rarely wait on Jira.
+
+        Prefetches the project list on startup, then periodically reloads
+        every cached entry before it expires. Jira calls, including creating
+        the client, run in worker threads via _run_jira.
+        """
+        pending = [(("projects",), self._render_projects)]
+        while True:
+            for key, loader in pending:
+                try:
+                    await self._refresh(key, loader)
+                except Exception as e:
+                    logger.warning(f"Background refresh of {key} failed: {e}")
+
+            await asyncio.sleep(_METADATA_REFRESH_INTERVAL)
+            pending = list(self._meta_loaders.items())
+
+            # The client caches priorities and issue types for its lifetime;
+            # drop them so refreshed project metadata picks up changes
+            if self.jira_client is not None:
+                self.jira_client.clear_metadata_cache()
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle tool calls."""
-        # Map tool names to handler methods
-        handlers = {
-            "get_issue_templates": self._get_issue_templates,
-            "create_jira_issue": self._create_jira_issue,
-            "get_jira_projects": self._get_jira_projects,
-            "search_jira_issues": self._search_jira_issues,
-            "get_jira_issue": self._get_jira_issue,
-            "get_project_metadata": self._get_project_metadata,
-        }
-
         try:
-            handler = handlers.get(name)
+            handler = self._handlers.get(name)
             if not handler:
                 raise ValueError(f"Unknown tool: {name}")
 
@@ -176,142 +280,161 @@ class JissueServer:
         """Get issue templates."""
         issue_type = args.get("issue_type")
 
-        if issue_type:
-            template = self.template_manager.get_template(issue_type)
-            if template:
-                result = f"# {issue_type.upper()} Template\n\n{template}"
-            else:
-                result = f"No template found for issue type: {issue_type}\n\nAvailable types: {', '.join(self.template_manager.list_templates())}"
-        else:
-            templates = self.template_manager.get_all_templates()
-            result = "# Available Issue Templates\n\n"
-            for itype, template in templates.items():
-                result += f"## {itype.upper()}\n\n{template}\n\n---\n\n"
+        if not issue_type:
+            return list(self._all_templates_content)
+
+        result = self.template_manager.get_rendered(issue_type)
+        if result is None:
+            result = f"No template found for issue type: {issue_type}\n\nAvailable types: {', '.join(self.template_manager.list_templates())}"
 
         return [TextContent(type="text", text=result)]
 
     async def _create_jira_issue(self, args: dict[str, Any]) -> list[TextContent]:
         """Create a Jira issue."""
-        # Validate input
-        issue_input = IssueInput(**args)
-
-        # Initialize Jira client if not already done
-        if self.jira_client is None:
-            self.jira_client = JiraClientWrapper()
+        # Arguments were already validated against the tool's inputSchema by the
+        # MCP layer, so build the model without re-running validation
+        issue_input = IssueInput.model_construct(**args)
 
         # Create the issue
-        issue_key = self.jira_client.create_issue(
-            project=issue_input.project,
-            issue_type=issue_input.issue_type,
-            summary=issue_input.summary,
-            description=issue_input.description,
-            priority=issue_input.priority,
-            assignee=issue_input.assignee
+        issue_key = await self._run_jira(
+            lambda client: client.create_issue(
+                project=issue_input.project,
+                issue_type=issue_input.issue_type,
+                summary=issue_input.summary,
+                description=issue_input.description,
+                priority=issue_input.priority,
+                assignee=issue_input.assignee
+            )
         )
 
-        issue_url = self.jira_client.get_issue_url(issue_key)
+        # The client exists once a call has completed, so this doesn't connect
+        issue_url = self._get_client().get_issue_url(issue_key)
 
         result = f"✓ Created Jira issue: {issue_key}\n\nURL: {issue_url}\n\nSummary: {issue_input.summary}"
         return [TextContent(type="text", text=result)]
 
     async def _get_jira_projects(self, args: dict[str, Any] | None = None) -> list[TextContent]:
         """Get list of Jira projects."""
-        if self.jira_client is None:
-            self.jira_client = JiraClientWrapper()
+        text = await self._cached(("projects",), self._render_projects)
+        return [TextContent(type="text", text=text)]
 
-        projects = self.jira_client.get_projects()
+    async def _render_projects(self) -> str:
+        """Fetch the project list and render it as markdown."""
+        projects = await self._run_jira(lambda client: client.get_projects())
 
-        result = "# Available Jira Projects\n\n"
-        for project in projects:
-            result += f"- **{project['key']}**: {project['name']}\n"
-
-        return [TextContent(type="text", text=result)]
+        project_lines = "".join(f"- **{p['key']}**: {p['name']}\n" for p in projects)
+        return f"# Available Jira Projects\n\n{project_lines}"
 
     async def _search_jira_issues(self, args: dict[str, Any]) -> list[TextContent]:
         """Search for Jira issues."""
-        if self.jira_client is None:
-            self.jira_client = JiraClientWrapper()
-
         query = args["query"]
         project = args.get("project")
         max_results = args.get("max_results", 10)
-
-        issues = self.jira_client.search_issues(
-            query=query,
-            project=project,
-            max_results=int(max_results)
+        output_format = args.get("format", "markdown")
+
+        issues = await self._run_jira(
+            lambda client: client.search_issues(
+                query=query,
+                project=project,
+                max_results=int(max_results),
+                description_limit=_SEARCH_DESCRIPTION_LIMIT
+            )
         )
 
+        if output_format == "json":
+            text = _dumps_json([
+                {
+                    "key": issue["key"],
+                    "summary": issue["summary"],
+                    "type": issue["type"],
+                    "status": issue["status"],
+                    "priority": issue.get("priority"),
+                    "url": issue["url"],
+                    "description": issue["description"],
+                }
+                for issue in issues
+            ])
+            return [TextContent(type="text", text=text)]
+
         if not issues:
-            result = f"No issues found matching: {query}"
-        else:
-            result = f"# Found {len(issues)} issue(s)\n\n"
-            for issue in issues:
-                result += f"## {issue['key']}: {issue['summary']}\n"
-                result += f"**Type:** {issue['type']} | **Status:** {issue['status']} | **Priority:** {issue.get('priority', 'N/A')}\n"
-                result += f"**URL:** {issue['url']}\n"
-                if issue.get('description'):
-                    # Truncate long descriptions
-                    desc = issue['description'][:200]
-                    if len(issue['description']) > 200:
-                        desc += "..."
-                    result += f"**Description:** {desc}\n"
-                result += "\n---\n\n"
+            return [TextContent(type="text", text=f"No issues found matching: {query}")]
+
+        parts = [f"# Found {len(issues)} issue(s)\n\n"]
+        for issue in issues:
+            parts.append(
+                f"## {issue['key']}: {issue['summary']}\n"
+                f"**Type:** {issue['type']} | **Status:** {issue['status']} | **Priority:** {issue.get('priority', 'N/A')}\n"
+                f"**URL:** {issue['url']}\n"
+            )
+            if issue['description']:
+                parts.append(f"**Description:** {issue['description']}\n")
+            parts.append("\n---\n\n")
 
-        return [TextContent(type="text", text=result)]
+        return [TextContent(type="text", text="".join(parts))]
 
     async def _get_jira_issue(self, args: dict[str, Any]) -> list[TextContent]:
         """Get detailed information about a specific Jira issue."""
-        if self.jira_client is None:
-            self.jira_client = JiraClientWrapper()
-
         issue_key = args["issue_key"]
-        issue = self.jira_client.get_issue(issue_key)
-
-        result = f"# {issue['key']}: {issue['summary']}\n\n"
-        result += f"**Type:** {issue['type']}\n"
-        result += f"**Status:** {issue['status']}\n"
-        result += f"**Priority:** {issue.get('priority', 'N/A')}\n"
-        result += f"**Assignee:** {issue.get('assignee', 'Unassigned')}\n"
-        result += f"**URL:** {issue['url']}\n\n"
-        result += f"## Description\n\n{issue.get('description', 'No description')}\n"
+        issue = await self._run_jira(lambda client: client.get_issue(issue_key))
+
+        result = (
+            f"# {issue['key']}: {issue['summary']}\n\n"
+            f"**Type:** {issue['type']}\n"
+            f"**Status:** {issue['status']}\n"
+            f"**Priority:** {issue.get('priority', 'N/A')}\n"
+            f"**Assignee:** {issue.get('assignee', 'Unassigned')}\n"
+            f"**URL:** {issue['url']}\n\n"
+            f"## Description\n\n{issue.get('description', 'No description')}\n"
+        )
 
         return [TextContent(type="text", text=result)]
 
     async def _get_project_metadata(self, args: dict[str, Any]) -> list[TextContent]:
         """Get project metadata including priorities and issue types."""
-        if self.jira_client is None:
-            self.jira_client = JiraClientWrapper()
-
         project_key = args["project_key"]
-        metadata = self.jira_client.get_project_metadata(project_key)
-
-        result = f"# {metadata['project']['key']} - {metadata['project']['name']}\n\n"
-
-        result += "## Available Priorities\n"
-        for priority in metadata['priorities']:
-            result += f"- {priority}\n"
-
-        result += "\n## Available Issue Types\n"
-        for issue_type in metadata['issue_types']:
-            result += f"- {issue_type}\n"
-
-        return [TextContent(type="text", text=result)]
+        text = await self._cached(("meta", project_key), lambda: self._render_project_metadata(project_key))
+        return [TextContent(type="text", text=text)]
+
+    async def _render_project_metadata(self, project_key: str) -> str:
+        """Fetch project metadata and render it as markdown."""
+        metadata = await self._run_jira(lambda client: client.get_project_metadata(project_key))
+
+        prio_lines = "".join(f"- {p}\n" for p in metadata['priorities'])
+        type_lines = "".join(f"- {t}\n" for t in metadata['issue_types'])
+        return (
+            f"# {metadata['project']['key']} - {metadata['project']['name']}\n\n"
+            f"## Available Priorities\n{prio_lines}"
+            f"\n## Available Issue Types\n{type_lines}"
+        )
 
 
 async def main():
     """Run the MCP server."""
+    # Configure logging only when running as the server, and only if the host
+    # process hasn't already set up handlers
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
+
     logger.info("Starting Jissue MCP Server...")
-    server = JissueServer()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.server.run(
-            read_stream,
-            write_stream,
-            server.server.create_initialization_options()
-        )
+    # Blocking Jira calls run in the default executor; size it to the concurrency limit
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_MAX_JIRA_CONCURRENCY, thread_name_prefix="jissue-jira")
+    )
+
+    server = JissueServer()
+    refresh_task = asyncio.create_task(server._bg_refresh_metadata())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.server.run(
+                read_stream,
+                write_stream,
+                server.server.create_initialization_options()
+            )
+    finally:
+        refresh_task.cancel()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -1,8 +1,13 @@
 """Template manager for Jira issue types."""
 
+import functools
 import logging
+import os
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from jissue.config import CONFIG_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +29,29 @@ class TemplateManager:
         if custom_template_dir:
             self.custom_dir = custom_template_dir
         else:
-            self.custom_dir = Path.home() / ".jissue" / "templates"
+            self.custom_dir = CONFIG_DIR / "templates"
+
+        # Load custom templates (empty if the directory doesn't exist)
+        self.custom_templates = self._load_custom_templates()
 
-        # Load custom templates if directory exists
-        self.custom_templates = {}
-        if self.custom_dir.exists():
-            self.custom_templates = self._load_custom_templates()
+        # Merge once; custom templates override defaults
+        self._merged = {**self.default_templates, **self.custom_templates}
+
+        # Per-instance cache keyed on the caller's spelling, so repeat lookups
+        # skip case normalization
+        self._lookup_template = functools.lru_cache(maxsize=32)(
+            lambda issue_type: self._merged.get(issue_type.lower())
+        )
+
+        # Pre-render markdown output; templates don't change after init
+        self._rendered_single = {
+            itype: f"# {itype.upper()} Template\n\n{template}"
+            for itype, template in self._merged.items()
+            if template
+        }
+        self._rendered_all = "# Available Issue Templates\n\n" + "".join(
+            [f"## {itype.upper()}\n\n{template}\n\n---\n\n" for itype, template in self._merged.items()]
+        )
 
     def _get_default_templates(self) -> Dict[str, str]:
         """Get default built-in templates."""
@@ -121,11 +143,14 @@ class TemplateManager:
         templates = {}
 
         try:
-            for template_file in self.custom_dir.glob("*.md"):
-                issue_type = template_file.stem
-                with open(template_file, 'r') as f:
-                    templates[issue_type] = f.read()
-                logger.info(f"Loaded custom template: {issue_type}")
+            with os.scandir(self.custom_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        issue_type = entry.name[:-3]
+                        templates[issue_type] = Path(entry.path).read_text(encoding="utf-8")
+                        logger.info(f"Loaded custom template: {issue_type}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error loading custom templates: {e}")
 
@@ -142,21 +167,30 @@ class TemplateManager:
         Returns:
             Template string or None if not found
         """
-        issue_type = issue_type.lower()
+        return self._lookup_template(issue_type)
+
+    def get_all_templates(self) -> Mapping[str, str]:
+        """Get all available templates (custom overrides default).
 
-        # Check custom templates first
-        if issue_type in self.custom_templates:
-            return self.custom_templates[issue_type]
+        Returns a read-only view of the merged templates.
+        """
+        return MappingProxyType(self._merged)
 
-        # Fall back to default templates
-        return self.default_templates.get(issue_type)
+    def get_rendered(self, issue_type: str) -> str | None:
+        """Get the rendered markdown for a specific issue type.
+
+        Args:
+            issue_type: Issue type (e.g., 'story', 'bug', 'task')
+
+        Returns:
+            Markdown string or None if no template is found
+        """
+        return self._rendered_single.get(issue_type.lower())
 
-    def get_all_templates(self) -> Dict[str, str]:
-        """Get all available templates (custom overrides default)."""
-        all_templates = self.default_templates.copy()
-        all_templates.update(self.custom_templates)
-        return all_templates
+    def get_rendered_all(self) -> str:
+        """Get rendered markdown listing all available templates."""
+        return self._rendered_all
 
     def list_templates(self) -> list[str]:
         """List all available template names."""
-        return list(self.get_all_templates().keys())
+        return list(self._merged)